@@ -0,0 +1,17 @@
+from webscraper.processing.data_processor import DataProcessor
+
+def test_filter_matches_any_keyword_case_insensitively():
+    p = DataProcessor(keywords=["Court", "appeal"])
+    assert p.filter_by_keywords("The COURT ruled")
+    assert not p.filter_by_keywords("nothing here")
+
+def test_empty_keyword_matches_everything():
+    assert DataProcessor(keywords=[""]).filter_by_keywords("anything")
+    assert DataProcessor(keywords=["", "court"]).filter_by_keywords("no match")
+    assert DataProcessor().filter_by_keywords("no keywords at all")
+
+def test_one_off_keywords_leave_processor_unchanged():
+    p = DataProcessor(keywords=["court"])
+    assert p.filter_by_keywords("an appeal", keywords=["appeal"])
+    assert p.keywords == ["court"]
+    assert not p.filter_by_keywords("an appeal")
@@ -0,0 +1,32 @@
+import random
+import re
+import time
+
+from webscraper.processing.input_sanitizer import InputSanitizer, strip_tags
+
+# Reference: the chunk0-2 regex the byte scanner replaced.
+TAG_RE = re.compile(r"(?is)<script\b[^>]*>.*?</script\s*>|<iframe\b[^>]*>.*?</iframe\s*>")
+
+PARTS = [
+    "<script>", "<SCRIPT a=1>", "</script>", "</ScRipt >", "<iframe>", "</iframe>",
+    "</iframe >", "<scripts>", "<iframe", "<script", "</script", "<p>", "x", "é",
+    "<", ">", "  ",
+]
+
+def test_matches_reference_regex_on_random_inputs():
+    rng = random.Random(1)
+    s = InputSanitizer()
+    for _ in range(200_000):
+        text = "".join(rng.choice(PARTS) for _ in range(rng.randint(0, 14)))
+        assert s.strip_scripts(text) == TAG_RE.sub("", text), text
+
+def test_bytes_in_bytes_out():
+    assert strip_tags(b"a<script>x</script>b") == b"ab"
+    assert InputSanitizer().strip_scripts(b"a<iframe src=y></iframe>b") == b"ab"
+
+def test_unclosed_openers_are_linear():
+    s = InputSanitizer()
+    start = time.perf_counter()
+    for payload in ("<script>" * 100_000, "<iframe x>" * 80_000 + "</iframe"):
+        assert s.strip_scripts(payload) == payload
+    assert time.perf_counter() - start < 1.0
@@ -0,0 +1,27 @@
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import pytest
+
+from webscraper.storage.storage_manager import StorageManager
+
+def read(path):
+    return (pq.read_table(path) if path.endswith(".parquet") else pacsv.read_csv(path)).to_pylist()
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_save_data_keeps_ragged_columns(tmp_path, fmt):
+    StorageManager(str(tmp_path), fmt).save_data([{"a": 1}, {"b": 2}], "out")
+    assert read(str(tmp_path / f"out.{fmt}")) == [{"a": 1, "b": None}, {"a": None, "b": 2}]
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_save_data_writes_null_and_mixed_columns(tmp_path, fmt):
+    StorageManager(str(tmp_path), fmt).save_data([{"a": None, "b": 1}, {"a": None, "b": "x"}], "out")
+    rows = read(str(tmp_path / f"out.{fmt}"))
+    assert [r["b"] for r in rows] == ["1", "x"]
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_streaming_rejects_all_null_first_batch(tmp_path, fmt):
+    exporter = StorageManager(str(tmp_path), fmt).open_export("out")
+    with pytest.raises(ValueError):
+        exporter.write_batch([{"a": None}])
+    exporter.abort()
+    assert not (tmp_path / f"out.{fmt}").exists()
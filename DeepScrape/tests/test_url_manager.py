@@ -0,0 +1,15 @@
+from webscraper.url.url_manager import URLManager, normalize_url
+
+def test_normalize_url():
+    assert normalize_url("HTTP://Example.COM:80/a#frag") == "http://example.com/a"
+    assert normalize_url("https://[::1]:8443") == "https://[::1]:8443/"
+
+def test_invalid_port_is_kept():
+    assert normalize_url("http://A.com:99999/") == "http://a.com:99999/"
+    assert normalize_url("http://a.com:99999/") != normalize_url("http://a.com/")
+
+def test_add_urls_skips_unparseable():
+    m = URLManager()
+    m.add_urls(["http://[::1", "http://a.com/", "http://A.com:80/"])
+    assert len(m) == 1
+    assert m.get_next_url() == "http://a.com/"
@@ -2,10 +2,23 @@
 DeepSeekAdapter:
 - Thin wrapper around an OpenAI-compatible API for DeepSeek.
 - Returns strict JSON (or raises).
+- extract_json_many(): run a batch concurrently (bounded by max_concurrency);
+  extract_json() is blocking, so each call goes through a worker thread.
 """
+import asyncio
+
 class DeepSeekAdapter:
+    def __init__(self, max_concurrency: int = 32):
+        self.max_concurrency = max_concurrency
     def extract_json(self, text: str, fields, hint: dict):
         # TODO: wire actual API client; for now return empty keys.
         return {k: "" for k in fields}
+    async def extract_json_many(self, texts, fields, hint=None):
+        """Results in input order; a failed call yields its exception instead."""
+        sem = asyncio.Semaphore(self.max_concurrency)
+        async def one(text):
+            async with sem:
+                return await asyncio.to_thread(self.extract_json, text, fields, hint or {})
+        return await asyncio.gather(*(one(t) for t in texts), return_exceptions=True)
     def health(self) -> bool:
         return True
@@ -14,3 +14,6 @@ class DeepSeekParser:
 
     def parse_data(self, text: str, fields):
         return self.adapter.extract_json(text, fields=fields, hint={})
+
+    async def parse_many(self, texts, fields):
+        return await self.adapter.extract_json_many(texts, fields=fields, hint={})
@@ -1,11 +1,45 @@
 """
 CrawlerManager:
 - Coordinates spiders, URL frontier, processing, and storage.
-- start_crawl(): main loop pulling URLs and processing items.
+- start_crawl(): fetches URLs concurrently (asyncio) and runs the CPU-bound
+  process_item step across a process pool; storage stays in this process.
+- Processed items are sent to DeepSeek in batches of DEEPSEEK_BATCH.
+- Rows are buffered column-wise (one list per field) and flushed to
+  storage every FLUSH_ROWS items.
 """
+import asyncio
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import List
+from urllib.parse import urlsplit
+import pyarrow as pa
+from webscraper.models.crawl_item import CrawlItem
+from webscraper.processing.data_processor import DataProcessor
 from webscraper.spiders.keyword_spider import KeywordSpider
 
+FLUSH_ROWS = 1000
+# Explicit, so an all-empty first batch can't fix a column to the null type.
+EXPORT_SCHEMA = pa.schema([(f, pa.string()) for f in CrawlItem.FIELDS])
+DEEPSEEK_BATCH = 32
+
+# Not fork: by the time the pool starts, asyncio.to_thread workers are running,
+# and a forked child can inherit a lock one of them holds and deadlock.
+_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+_worker_processor = None
+
+def _init_worker(keywords):
+    """Pool initializer: one DataProcessor (and keyword automaton) per process."""
+    global _worker_processor
+    _worker_processor = DataProcessor(keywords=keywords)
+
+def _process_item_worker(item, fields):
+    return _worker_processor.process_item(item, fields=fields)
+
 class CrawlerManager:
     def __init__(self, settings, storage, data_processor, url_manager):
         self.settings = settings
@@ -15,21 +49,99 @@ class CrawlerManager:
         self.spiders: List[KeywordSpider] = []
 
     def start_crawl(self, urls, keywords, fields):
-        spider = KeywordSpider(keywords=keywords, data_processor=self.data_processor)
+        cfg = self.settings.get_settings() or {}
+        spider = KeywordSpider(
+            keywords=keywords,
+            data_processor=self.data_processor,
+            cache_dir=cfg.get("http_cache_dir"),
+        )
         self.spiders.append(spider)
         self.url_manager.add_urls(urls)
-        rows = []
+        exporter = None
+        count = 0
+
+        def flush(cols):
+            nonlocal exporter, count
+            n = len(cols[CrawlItem.FIELDS[0]])
+            if not n:
+                return
+            if exporter is None:
+                exporter = self.storage.open_export("export", schema=EXPORT_SCHEMA)
+            exporter.write_columns(cols)
+            count += n
+
+        try:
+            asyncio.run(self._crawl(spider, fields, flush))
+        except BaseException:
+            if exporter is not None:
+                exporter.close()  # keep batches already flushed
+            raise
+        finally:
+            spider.close()
+        if exporter is not None:
+            self.storage.finish_export(exporter)
+        return {"items": count}
+
+    async def _crawl(self, spider, fields, flush):
+        cfg = self.settings.get_settings() or {}
+        concurrency = int(cfg.get("max_concurrency", 32))
+        delay = float(cfg.get("delay_sec", 0))
+        loop = asyncio.get_running_loop()
+        sem = asyncio.Semaphore(concurrency)
+        next_slot = {}
+
+        async def fetch(client, url):
+            # Per-domain politeness: space requests to one host by delay_sec.
+            host = urlsplit(url).hostname or ""
+            start = max(loop.time(), next_slot.get(host, 0.0))
+            next_slot[host] = start + delay
+            await asyncio.sleep(start - loop.time())
+            async with sem:
+                return await spider.parse(url, client)
+
+        async def handle(client, pool, url):
+            items = await fetch(client, url)
+            return await asyncio.gather(*(
+                loop.run_in_executor(pool, _process_item_worker, item, fields)
+                for item in items
+            ))
+
+        urls = []
         while True:
             url = self.url_manager.get_next_url()
             if not url:
                 break
-            for item in spider.parse(url):
-                processed = self.data_processor.process_item(item, fields=fields)
-                if processed:
-                    rows.append(processed.to_dict())
-        if rows:
-            self.storage.save_data(rows, "export")
-        return {"items": len(rows)}
+            urls.append(url)
+
+        required = frozenset(sys.intern(f) for f in fields)
+        def new_cols():
+            return {f: [] for f in CrawlItem.FIELDS}
+
+        cols = new_cols()
+        pending = []
+
+        async def enrich():
+            kept = await self.data_processor.enrich_many(pending, fields=fields, required=required)
+            for f, col in cols.items():
+                col.extend(getattr(item, f) for item in kept)
+            pending.clear()
+
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=_MP_CONTEXT,
+            initializer=_init_worker, initargs=(spider.keywords,),
+        ) as pool:
+            async with spider.make_client(max_connections=concurrency) as client:
+                tasks = [handle(client, pool, u) for u in urls]
+                for done in asyncio.as_completed(tasks):
+                    pending.extend(p for p in await done if p)
+                    if len(pending) >= DEEPSEEK_BATCH:
+                        await enrich()
+                    if len(cols[CrawlItem.FIELDS[0]]) >= FLUSH_ROWS:
+                        flush(cols)
+                        cols = new_cols()
+            if pending:
+                await enrich()
+        flush(cols)
 
     def stop_crawling(self):
         """Cooperative stop (stub)."""
@@ -0,0 +1 @@
+"""Data models passed between spiders, processing, and storage."""
@@ -0,0 +1,40 @@
+"""
+CrawlItem:
+- One fetched page (url, title, content) flowing through processing.
+- content_lower is computed once and reset whenever content is replaced.
+- __slots__ keeps per-item memory small (no instance __dict__).
+"""
+class CrawlItem:
+    __slots__ = ("url", "title", "_content", "_lc")
+    FIELDS = ("url", "title", "content")
+
+    def __init__(self, url: str, title: str = "", content: str = ""):
+        self.url = url
+        self.title = title
+        self.content = content
+
+    @property
+    def content(self) -> str:
+        return self._content
+
+    @content.setter
+    def content(self, value: str):
+        self._content = value
+        self._lc = None
+
+    @property
+    def content_lower(self) -> str:
+        if self._lc is None:
+            self._lc = self._content.lower()
+        return self._lc
+
+    def __getstate__(self):
+        # Leave out the cached lowercase copy so pickles (pool IPC, HTTP cache)
+        # don't carry the page twice.
+        return (self.url, self.title, self._content)
+
+    def __setstate__(self, state):
+        self.url, self.title, self.content = state
+
+    def to_dict(self) -> dict:
+        return {f: getattr(self, f) for f in self.FIELDS}
@@ -1,38 +1,78 @@
 """
 DataProcessor:
 - clean_text(): sanitize HTML/text.
-- filter_by_keywords(): quick boolean filter.
+- filter_by_keywords(): quick boolean filter (single-pass Aho-Corasick scan).
 - calculate_relevance_score(): heuristic scoring.
-- process_item(): main pipeline; optionally calls DeepSeek.
+- process_item(): per-item cleaning + keyword filter (safe to run in a
+  worker process); rejects pages before they reach DeepSeek.
+- enrich_many(): batched DeepSeek extraction + validation.
 """
+import ahocorasick
 from webscraper.processing.input_sanitizer import InputSanitizer
 from webscraper.processing.schema_validator import SchemaValidator
 from webscraper.deepseek.parser import DeepSeekParser
 
+def _build_automaton(keywords):
+    """One automaton over all keywords so content is walked once.
+
+    None means match everything: no keywords, or an empty one (which, as a
+    substring, is in every page; pyahocorasick would ignore it).
+    """
+    if not keywords or "" in keywords:
+        return None
+    ac = ahocorasick.Automaton()
+    for k in keywords:
+        ac.add_word(k.lower(), k)
+    ac.make_automaton()
+    return ac
+
 class DataProcessor:
-    def __init__(self):
+    def __init__(self, keywords=None):
         self.sanitizer = InputSanitizer()
         self.validator = SchemaValidator()
         self.deepseek = DeepSeekParser()
+        self.set_keywords(keywords)
+
+    def set_keywords(self, keywords):
+        self.keywords = list(keywords or [])
+        self._ac = _build_automaton(self.keywords)
 
     def clean_text(self, text: str) -> str:
-        return self.sanitizer.strip_scripts(self.sanitizer.remove_iframes(text))
+        # strip_scripts removes <script> and <iframe>, so one pass is enough.
+        return self.sanitizer.strip_scripts(text)
 
-    def filter_by_keywords(self, content: str, keywords) -> bool:
-        if not keywords:
+    def filter_by_keywords(self, content: str, keywords=None, content_lower=None) -> bool:
+        """Match against self.keywords; a `keywords` argument is a one-off check
+        with its own automaton and leaves the processor unchanged. Pass
+        `content_lower` (e.g. item.content_lower) to skip re-lowering."""
+        ac = self._ac if keywords is None else _build_automaton(keywords)
+        if ac is None:
             return True
-        c = content.lower()
-        return any(k.lower() in c for k in keywords)
+        if content_lower is None:
+            content_lower = content.lower()
+        for _ in ac.iter(content_lower):
+            return True
+        return False
 
     def calculate_relevance_score(self, content: str) -> float:
         return min(1.0, len(content) / 5000.0)
 
     def process_item(self, item, fields):
+        """Clean the item; None if it matches none of self.keywords."""
         item.content = self.clean_text(item.content)
-        try:
-            data = self.deepseek.parse_data(item.content, fields=fields)
-            if self.validator.validate(data, required=fields):
-                return item
-        except Exception:
+        if not self.filter_by_keywords(item.content, content_lower=item.content_lower):
             return None
         return item
+
+    async def enrich_many(self, items, fields, required=None):
+        """Run DeepSeek over a batch concurrently; keep items that validate.
+
+        `required` defaults to `fields`; pass a frozenset built once per crawl.
+        """
+        if required is None:
+            required = frozenset(fields)
+        results = await self.deepseek.parse_many([i.content for i in items], fields=fields)
+        return [
+            item for item, data in zip(items, results)
+            if not isinstance(data, Exception) and self.validator.validate(data, required=required)
+        ]
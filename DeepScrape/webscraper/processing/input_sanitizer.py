@@ -3,12 +3,76 @@ InputSanitizer:
 - Remove <script>/<iframe> blocks.
 - Clamp size to prevent resource abuse.
 """
-import re
+_WS = b" \t\n\r\f\v"
+# Bytes that continue a tag name; non-ASCII counts, like a word char for \b.
+_NAME_CHARS = b"abcdefghijklmnopqrstuvwxyz0123456789_" + bytes(range(0x80, 0x100))
+
+def strip_tags(buf: bytes, tags=(b"script", b"iframe")) -> bytes:
+    """Drop <tag ...>...</tag> blocks from raw bytes (tag names lowercase).
+
+    Each tag's next "<tag" opener is located with bytes.find (memmem), so the
+    Python loop runs once per candidate tag, not once per '<'. Searching is
+    done on an ASCII-lowercased copy so offsets line up with `buf`.
+    """
+    low = buf.lower()
+    n = len(low)
+    opens = [b"<" + t for t in tags]
+    closes = [b"</" + t for t in tags]
+    nxt = [low.find(o) for o in opens]
+    out = []
+    keep = 0
+    while True:
+        live = [p for p in nxt if p != -1]
+        if not live:
+            break
+        i = min(live)
+        t = nxt.index(i)
+        j = i + len(opens[t])
+        end = -1
+        is_tag = j >= n or low[j] not in _NAME_CHARS
+        if is_tag:
+            gt = low.find(b">", j)
+            close = closes[t]
+            k = low.find(close, gt + 1) if gt != -1 else -1
+            while k != -1:
+                m = k + len(close)
+                while m < n and low[m] in _WS:
+                    m += 1
+                if m < n and low[m] == 0x3E:  # '>'
+                    end = m + 1
+                    break
+                k = low.find(close, m)
+        if end == -1:
+            # A real opener with no close means no later opener closes either;
+            # retire the tag so the scan stays linear.
+            nxt[t] = -1 if is_tag else low.find(opens[t], i + 1)
+            continue
+        out.append(buf[keep:i])
+        keep = end
+        # Openers inside the removed block are skipped, as the regex would.
+        nxt = [p if p >= end or p == -1 else low.find(o, end) for p, o in zip(nxt, opens)]
+    if not out:
+        return buf
+    out.append(buf[keep:])
+    return b"".join(out)
+
 class InputSanitizer:
-    TAG_RE = re.compile(r"(?is)<(script|iframe)[^>]*>.*?</\\1>")
-    def strip_scripts(self, html_or_text: str) -> str:
-        return self.TAG_RE.sub("", html_or_text)
-    def remove_iframes(self, html_or_text: str) -> str:
-        return self.TAG_RE.sub("", html_or_text)
-    def clamp_size(self, text: str, max_bytes: int = 800000) -> str:
-        return text.encode()[:max_bytes].decode(errors="ignore")
+    def strip_scripts(self, html_or_text):
+        """Remove <script> and <iframe> blocks; accepts str or bytes."""
+        if isinstance(html_or_text, bytes):
+            return strip_tags(html_or_text)
+        return strip_tags(html_or_text.encode()).decode()
+    def remove_iframes(self, html_or_text):
+        return self.strip_scripts(html_or_text)
+    def clamp_size(self, text, max_bytes: int = 800000):
+        if isinstance(text, bytes):
+            return text[:max_bytes]
+        if text.isascii():  # O(1) flag check; one char == one byte
+            return text[:max_bytes]
+        # max_bytes chars encode to >= max_bytes bytes, so only that prefix
+        # ever needs encoding, however large the input.
+        head = text[:max_bytes]
+        raw = head.encode()
+        if len(raw) <= max_bytes:
+            return head
+        return raw[:max_bytes].decode(errors="ignore")
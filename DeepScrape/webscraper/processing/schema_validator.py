@@ -5,9 +5,11 @@ SchemaValidator:
 """
 class SchemaValidator:
     def validate(self, data: dict, required):
+        """`required` may be a prebuilt frozenset (fastest in hot loops)."""
         if not isinstance(data, dict): return False
-        for k in (required or []):
-            if k not in data: return False
-        return True
+        if not required: return True
+        if not isinstance(required, frozenset):
+            required = frozenset(required)
+        return len(data) >= len(required) and data.keys() >= required
     def enforce_types(self, data: dict, spec: dict) -> dict:
         return data
@@ -1,12 +1,29 @@
 """
 SettingsManager:
 - Loads YAML config and exposes accessors.
+- Parsed files are cached per path, so extra instances (e.g. in pool
+  workers) don't reparse; each instance gets its own copy to update.
 """
+import copy
+import os
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml C binding
+except ImportError:
+    from yaml import SafeLoader
+
+_CACHE = {}
+
+def _load(path):
+    key = os.path.abspath(path)
+    if key not in _CACHE:
+        with open(path, "r") as f:
+            _CACHE[key] = yaml.load(f, Loader=SafeLoader)
+    return copy.deepcopy(_CACHE[key])
+
 class SettingsManager:
     def __init__(self, path="config/settings.yaml"):
-        with open(path, "r") as f:
-            self._cfg = yaml.safe_load(f)
+        self._cfg = _load(path)
     def get_settings(self): return self._cfg
     def update_settings(self, new_settings: dict): self._cfg.update(new_settings or {})
     def validate_settings(self): return True
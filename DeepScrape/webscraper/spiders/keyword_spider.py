@@ -1,26 +1,76 @@
 """
 KeywordSpider:
-- Fetch a URL with httpx (basic).
-- Pull <title> and full text via BeautifulSoup.
+- Fetch a URL with a shared httpx.AsyncClient.
+- Pull <title> and full text via selectolax (Lexbor C backend).
 - Emit CrawlItem for downstream processing.
+- Conditional GETs (ETag/Last-Modified): a 304 rebuilds the CrawlItem from
+  the cached fields without reparsing; an unreadable entry counts as a miss.
+  Only enabled when cache_dir is given; close() it after the crawl.
 """
+import asyncio
+import diskcache
 import httpx
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from webscraper.models.crawl_item import CrawlItem
 
 class KeywordSpider:
-    def __init__(self, keywords, data_processor, allowed_domains=None):
+    def __init__(self, keywords, data_processor, allowed_domains=None, cache_dir=None):
         self.keywords = keywords or []
         self.data_processor = data_processor
         self.allowed_domains = allowed_domains or []
+        # url -> (etag, last_modified, url, title, content): plain values, so
+        # entries survive changes to CrawlItem. SQLite-backed, so every access
+        # goes through asyncio.to_thread to keep the event loop free.
+        self._cache = diskcache.Cache(cache_dir) if cache_dir else None
 
-    def parse(self, url: str):
+    def close(self):
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+
+    @staticmethod
+    def make_client(max_connections: int = 64) -> httpx.AsyncClient:
+        """One pooled HTTP/2 client shared by every fetch in a crawl."""
+        return httpx.AsyncClient(
+            http2=True,
+            timeout=15,
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+
+    async def parse(self, url: str, client: httpx.AsyncClient):
+        cached = None
+        if self._cache is not None:
+            try:
+                etag, last_modified, c_url, c_title, c_content = await asyncio.to_thread(
+                    self._cache.get, url
+                )
+                cached = CrawlItem(c_url, c_title, c_content)
+            except Exception:
+                pass  # missing, unreadable or old-format entry: fetch in full
+        headers = {}
+        if cached is not None:
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
         try:
-            r = httpx.get(url, timeout=15)
+            r = await client.get(url, headers=headers)
+            if r.status_code == 304 and cached is not None:
+                return [cached]
             r.raise_for_status()
         except Exception:
             return []
-        soup = BeautifulSoup(r.text, "lxml")
-        title = (soup.title.string.strip() if soup.title else "") or url
-        text = soup.get_text(separator=" ", strip=True)
-        yield CrawlItem(url=url, title=title, content=text)
+        tree = LexborHTMLParser(r.text)
+        node = tree.css_first("title")
+        title = (node.text(strip=True) if node else "") or url
+        root = tree.body or tree.root
+        text = root.text(separator=" ", strip=True) if root else ""
+        item = CrawlItem(url=url, title=title, content=text)
+        etag = r.headers.get("ETag")
+        last_modified = r.headers.get("Last-Modified")
+        if self._cache is not None and (etag or last_modified):
+            try:
+                await asyncio.to_thread(self._cache.set, url, (etag, last_modified, url, title, text))
+            except Exception:
+                pass  # caching is best-effort
+        return [item]
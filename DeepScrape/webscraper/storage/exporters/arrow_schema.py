@@ -0,0 +1,53 @@
+"""
+Schema handling shared by the Arrow-backed exporters.
+- Columns are the union of the row keys; a row missing a key gets null.
+- write() sees every row at once, so a column that is all-null becomes
+  string and one with mixed types is written as strings.
+- Streaming batches fix the schema from the first batch (or `schema`): an
+  all-null column there is rejected since its type can't be inferred, and
+  CSV needs scalar values. Pass an explicit pyarrow.Schema to avoid both.
+"""
+import pyarrow as pa
+from webscraper.storage.exporters.base import Exporter
+
+def check_schema(schema: pa.Schema, nested_ok: bool = True) -> None:
+    for field in schema:
+        if pa.types.is_null(field.type):
+            raise ValueError(
+                f"column {field.name!r} is all-null in the first batch; "
+                "its type can't be inferred, pass an explicit schema"
+            )
+        if not nested_ok and pa.types.is_nested(field.type):
+            raise ValueError(f"column {field.name!r} holds {field.type} values; CSV needs scalars")
+
+def _loose_array(values):
+    try:
+        arr = pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array([None if v is None else str(v) for v in values], pa.string())
+    return arr.cast(pa.string()) if pa.types.is_null(arr.type) else arr
+
+def columns_to_table(cols, schema=None, loose=False):
+    if schema is not None or not loose:
+        return pa.Table.from_pydict(cols, schema=schema)
+    return pa.table({name: _loose_array(values) for name, values in cols.items()})
+
+def rows_to_table(rows, schema=None, loose=False):
+    if schema is not None:
+        return pa.Table.from_pylist(rows, schema=schema)
+    keys = dict.fromkeys(k for row in rows for k in row)
+    return columns_to_table({k: [row.get(k) for row in rows] for k in keys}, loose=loose)
+
+class ArrowExporter(Exporter):
+    """Turns rows or columns into Arrow tables; subclasses implement _write(table)."""
+    def __init__(self, schema=None):
+        self._schema = schema
+    def write_batch(self, rows):
+        self._write(rows_to_table(rows, self._schema))
+    def write_columns(self, cols):
+        """Write a dict of column lists; Arrow ingests it without per-row dicts."""
+        self._write(columns_to_table(cols, self._schema))
+    def _write_all(self, rows):
+        self._write(rows_to_table(rows, self._schema, loose=True))
+    def _write(self, table):
+        raise NotImplementedError
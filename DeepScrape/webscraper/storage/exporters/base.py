@@ -0,0 +1,29 @@
+import os
+class Exporter:
+    """File lifecycle shared by the exporters.
+
+    Streaming: open(path), write_batch()/write_columns() any number of times,
+    then close() (or abort() to drop the partial file). write() does all of
+    that for a single list of rows.
+    """
+    ext = None
+    def open(self, path):
+        self.path = path
+        return self
+    def close(self):
+        raise NotImplementedError
+    def abort(self):
+        """Close and delete the partial file."""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+    def write(self, rows, path):
+        self.open(path)
+        try:
+            self._write_all(rows)
+        except BaseException:
+            self.abort()
+            raise
+        self.close()
+    def _write_all(self, rows):
+        self.write_batch(rows)
@@ -1,5 +1,30 @@
-import pandas as pd
-class CSVExporter:
-    """Write rows to CSV."""
-    def write(self, rows, path):
-        pd.DataFrame(rows).to_csv(path, index=False)
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from webscraper.storage.exporters.arrow_schema import ArrowExporter, check_schema
+_SUFFIX = {"zstd": "zst", "gzip": "gz"}
+class CSVExporter(ArrowExporter):
+    """Stream rows to CSV as Arrow record batches (optionally compressed)."""
+    def __init__(self, compression=None, schema=None):
+        super().__init__(schema)
+        self.compression = compression
+        self.ext = f"csv.{_SUFFIX.get(compression, compression)}" if compression else "csv"
+        self._writer = None
+        self._sink = None
+    def _write(self, table):
+        if self._writer is None:
+            check_schema(table.schema, nested_ok=False)
+            self._schema = table.schema
+            self._sink = (
+                pa.CompressedOutputStream(self.path, self.compression)
+                if self.compression else pa.OSFile(self.path, "wb")
+            )
+            self._writer = pacsv.CSVWriter(
+                self._sink, self._schema,
+                write_options=pacsv.WriteOptions(batch_size=8192),
+            )
+        self._writer.write_table(table)
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._sink.close()
+            self._writer = self._sink = None
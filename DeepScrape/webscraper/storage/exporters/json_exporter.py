@@ -1,6 +1,20 @@
-import json
-class JSONExporter:
-    """Write rows to JSON."""
-    def write(self, rows, path):
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(rows, f, ensure_ascii=False, indent=2)
+import orjson
+from webscraper.storage.exporters.base import Exporter
+class JSONExporter(Exporter):
+    """Stream rows to newline-delimited JSON (`schema` is accepted and unused)."""
+    ext = "jsonl"
+    def __init__(self, schema=None):
+        self._f = None
+    def open(self, path):
+        super().open(path)
+        self._f = open(path, "wb", buffering=1 << 20)  # fewer write() syscalls
+        return self
+    def write_batch(self, rows):
+        self._f.writelines(orjson.dumps(row) + b"\n" for row in rows)
+    def write_columns(self, cols):
+        keys = list(cols)
+        self.write_batch(dict(zip(keys, vals)) for vals in zip(*cols.values()))
+    def close(self):
+        if self._f is not None:
+            self._f.close()
+            self._f = None
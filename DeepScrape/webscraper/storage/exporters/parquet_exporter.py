@@ -1,5 +1,18 @@
-import pandas as pd
-class ParquetExporter:
-    """Write rows to Parquet (requires pyarrow)."""
-    def write(self, rows, path):
-        pd.DataFrame(rows).to_parquet(path, index=False)
+import pyarrow.parquet as pq
+from webscraper.storage.exporters.arrow_schema import ArrowExporter, check_schema
+class ParquetExporter(ArrowExporter):
+    """Stream rows to Parquet (zstd), one row group per batch."""
+    ext = "parquet"
+    def __init__(self, schema=None):
+        super().__init__(schema)
+        self._writer = None
+    def _write(self, table):
+        if self._writer is None:
+            check_schema(table.schema)
+            self._schema = table.schema
+            self._writer = pq.ParquetWriter(self.path, self._schema, compression="zstd")
+        self._writer.write_table(table)
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
@@ -1,24 +1,43 @@
 """
 StorageManager:
-- Save rows (dicts) as CSV/JSON/Parquet based on config.
+- Save rows (dicts) as CSV (plain or zstd)/JSON/Parquet based on config.
+- open_export() returns a streaming exporter so callers can flush batches
+  instead of holding every row in memory; finish_export() closes it.
+- Schema rules for CSV/Parquet: see exporters/arrow_schema.py.
 """
 import os
+from functools import partial
 from webscraper.storage.exporters.csv_exporter import CSVExporter
 from webscraper.storage.exporters.json_exporter import JSONExporter
 from webscraper.storage.exporters.parquet_exporter import ParquetExporter
 
+EXPORTERS = {
+    "csv": CSVExporter,
+    "csv.zst": partial(CSVExporter, compression="zstd"),
+    "json": JSONExporter,
+    "parquet": ParquetExporter,
+}
+
 class StorageManager:
     def __init__(self, output_dir="data/exports", output_format="csv"):
         self.output_dir = output_dir
         self.output_format = output_format
 
-    def save_data(self, rows, filename):
+    def _exporter(self, filename, schema):
         os.makedirs(self.output_dir, exist_ok=True)
-        path = os.path.join(self.output_dir, f"{filename}.{self.output_format}")
-        if self.output_format == "csv":
-            CSVExporter().write(rows, path)
-        elif self.output_format == "json":
-            JSONExporter().write(rows, path)
-        else:
-            ParquetExporter().write(rows, path)
+        exporter = EXPORTERS.get(self.output_format, ParquetExporter)(schema=schema)
+        return exporter, os.path.join(self.output_dir, f"{filename}.{exporter.ext}")
+
+    def open_export(self, filename, schema=None):
+        """Open an exporter for `filename`; write batches, then finish_export()."""
+        exporter, path = self._exporter(filename, schema)
+        return exporter.open(path)
+
+    def finish_export(self, exporter):
+        exporter.close()
+        print(f"[export] {exporter.path}")
+
+    def save_data(self, rows, filename, schema=None):
+        exporter, path = self._exporter(filename, schema)
+        exporter.write(rows, path)
         print(f"[export] {path}")
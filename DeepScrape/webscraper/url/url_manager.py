@@ -1,18 +1,77 @@
 """
 URLManager:
-- Simple queue + visited set (cap by max_urls).
+- Per-domain queues served round-robin + visited set (cap by max_urls),
+  so consecutive URLs spread across hosts instead of bursting one.
+- Seen/visited URLs are kept as 64-bit xxh3 fingerprints of the
+  normalized URL rather than full strings.
+- URLs urlsplit() can't parse are skipped rather than queued.
 """
 from collections import deque
+from urllib.parse import urlsplit, urlunsplit
+import xxhash
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+def normalize_url(u: str) -> str:
+    """Lowercase scheme/host and drop the default port and fragment."""
+    p = urlsplit(u.strip())
+    scheme = p.scheme.lower()
+    host = (p.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"  # IPv6 literal
+    try:
+        port = p.port
+    except ValueError:
+        # Out of range or non-numeric: keep it verbatim so the URL stays distinct.
+        host = f"{host}:{p.netloc.rpartition(':')[2]}"
+        port = None
+    if port is not None and port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    if p.username is not None:
+        auth = p.username + (f":{p.password}" if p.password is not None else "")
+        host = f"{auth}@{host}"
+    return urlunsplit((scheme, host, p.path or "/", p.query, ""))
+
+def fingerprint(u: str) -> int:
+    return xxhash.xxh3_64_intdigest(normalize_url(u).encode())
+
 class URLManager:
     def __init__(self, max_urls: int = 200):
         self.visited = set()
-        self.queue = deque()
+        self._per_domain = {}   # host -> deque of (url, fingerprint)
+        self._domains = deque() # hosts with queued URLs, in serving order
+        self._size = 0
+        self._queued = set()    # fingerprints currently waiting in the frontier
         self.max = max_urls
+    def __len__(self): return self._size
     def add_urls(self, urls):
         for u in urls:
-            if u not in self.visited and len(self.queue) < self.max:
-                self.queue.append(u)
+            try:
+                h = fingerprint(u)
+            except ValueError:
+                continue  # unparseable, e.g. "http://[::1"
+            if h in self.visited or h in self._queued or self._size >= self.max:
+                continue
+            host = (urlsplit(u).hostname or "").lower()
+            q = self._per_domain.get(host)
+            if q is None:
+                q = self._per_domain[host] = deque()
+                self._domains.append(host)
+            q.append((u, h))
+            self._queued.add(h)
+            self._size += 1
     def get_next_url(self):
-        return self.queue.popleft() if self.queue else None
-    def mark_visited(self, u): self.visited.add(u)
-    def should_visit(self, u): return (u not in self.visited) and (len(self.visited) < self.max)
+        if not self._domains:
+            return None
+        host = self._domains.popleft()
+        q = self._per_domain[host]
+        u, h = q.popleft()
+        self._queued.discard(h)
+        if q:
+            self._domains.append(host)
+        else:
+            del self._per_domain[host]
+        self._size -= 1
+        return u
+    def mark_visited(self, u): self.visited.add(fingerprint(u))
+    def should_visit(self, u): return (fingerprint(u) not in self.visited) and (len(self.visited) < self.max)